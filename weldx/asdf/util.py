@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Hashable, Mapping, MutableMapping, Set
 from contextlib import contextmanager
+from functools import cache
 from io import BytesIO, TextIOBase
 from pathlib import Path
 from typing import Any
@@ -522,8 +523,8 @@ def uri_match(patterns: str | list[str], uri: str) -> bool:
     return any(asdf_uri_match(p, uri) for p in patterns)
 
 
-def get_converter_for_tag(tag: str) -> WeldxConverter | None:
-    """Get the converter class that handles a given tag."""
+@cache
+def _get_converter_for_tag(tag: str, _num_converters: int) -> WeldxConverter | None:
     converters = [s for s in WeldxConverter.__subclasses__() if uri_match(s.tags, tag)]
     if len(converters) > 1:
         warn(
@@ -534,6 +535,13 @@ def get_converter_for_tag(tag: str) -> WeldxConverter | None:
     return None
 
 
+def get_converter_for_tag(tag: str) -> WeldxConverter | None:
+    """Get the converter class that handles a given tag."""
+    # the subclass count is part of the cache key, so registering additional
+    # converters after the first lookup invalidates stale entries
+    return _get_converter_for_tag(tag, len(WeldxConverter.__subclasses__()))
+
+
 def get_highest_tag_version(
     pattern: str | list[str], ctx: SerializationContext | AsdfConfig = None
 ) -> str | None:
@@ -652,7 +660,7 @@ class _ProtectedViewDict(MutableMapping):
         return method_obj(key)
 
     def __len__(self) -> int:
-        return len(self.keys())
+        return len(self.__data) - sum(k in self.__data for k in self.protected_keys)
 
     def __getitem__(self, key):
         return self._wrap_protected_non_existent(key, "__getitem__")
@@ -670,10 +678,10 @@ class _ProtectedViewDict(MutableMapping):
         return {k for k in self.__data.keys() if k not in self.protected_keys}
 
     def __iter__(self):
-        return (k for k in self.keys())
+        return (k for k in self.__data if k not in self.protected_keys)
 
     def __contains__(self, item):
-        return item in self.keys()
+        return item in self.__data and item not in self.protected_keys
 
     def update(self, mapping: Mapping[Hashable, Any], **kwargs: Any):  # pylint: disable=W0221
         _mapping = dict(mapping, **kwargs)  # merge mapping and kwargs
@@ -700,9 +708,7 @@ class _ProtectedViewDict(MutableMapping):
         assert len(self) == 0
 
     def _warn_protected_keys(self, stacklevel=3):
-        import warnings
-
-        warnings.warn(
+        warn(
             "You tried to manipulate an ASDF internal structure"
             f" (currently protected: {self.protected_keys}",
             stacklevel=stacklevel,
@@ -5,6 +5,7 @@ from __future__ import annotations
 import re
 from collections import OrderedDict
 from collections.abc import Callable, Iterator, Mapping
+from functools import cache
 from typing import Any
 
 from asdf.exceptions import ValidationError
@@ -52,18 +53,25 @@ def _walk_validator(
     if position is None:  # pragma: no cover
         position = []
     if isinstance(validator_dict, dict):
+        # reuse a single path list (append/pop around each step) instead of
+        # allocating a new one per visited key; the validator functions format
+        # their error messages at yield time, so the path is always current
         for key, item in validator_dict.items():
             if isinstance(item, Mapping):
+                position.append(key)
                 yield from _walk_validator(
                     instance[key],
                     validator_dict[key],
                     validator_function,
-                    position=position + [key],
+                    position=position,
                     allow_missing_keys=allow_missing_keys,
                 )
+                position.pop()
             else:
                 if key in instance:
-                    yield from validator_function(instance[key], item, position + [key])
+                    position.append(key)
+                    yield from validator_function(instance[key], item, position)
+                    position.pop()
                 elif allow_missing_keys:  # pragma: no cover
                     pass
                 else:  # pragma: no cover
@@ -75,6 +83,16 @@ def _walk_validator(
         yield from validator_function(instance, validator_dict, position)
 
 
+@cache
+def _get_expected_units(expected_dimensionality: str):
+    """Parse an expected dimensionality string into a unit (cached).
+
+    The expected dimensionality comes from the schema and is identical for every
+    validated instance, so the parsing cost is only paid once per unique string.
+    """
+    return U_(expected_dimensionality)
+
+
 def _unit_validator(
     instance: Mapping, expected_dimensionality: str, position: list[str]
 ) -> Iterator[ValidationError]:
@@ -94,26 +112,69 @@ def _unit_validator(
     asdf.exceptions.ValidationError
 
     """
-    if not position:
-        position = instance
-
     units = _get_instance_units(instance)
     if units is None:
+        # build the position representation lazily - only failures need it
         yield ValidationError(
-            f"Error validating unit dimension for property '{position}'. "
+            f"Error validating unit dimension for property "
+            f"'{position if position else instance}'. "
             f"Expected unit of dimension '{expected_dimensionality}' "
             "but found no unit information"
         )
     else:
-        valid = units.is_compatible_with(U_(expected_dimensionality))
+        valid = units.is_compatible_with(_get_expected_units(expected_dimensionality))
         if not valid:
             yield ValidationError(
-                f"Error validating unit dimension for property '{position}'. "
+                f"Error validating unit dimension for property "
+                f"'{position if position else instance}'. "
                 f"Expected unit of dimension '{expected_dimensionality}' "
                 f"but got unit '{units}'"
             )
 
 
+_OPT_RE = re.compile(r"\((.*)\)")
+"""Compiled pattern extracting the contents of an optional ``(...)`` token."""
+
+
+@cache
+def _parse_range_bounds(exp_string: str) -> tuple[int, int | None]:
+    """Parse the integer bounds of an ``"a~b"`` range token (cached).
+
+    An open lower bound is returned as ``0``, an open upper bound as ``None``.
+
+    Raises
+    ------
+    WxSyntaxError
+        If a bound contains non numeric characters.
+
+    """
+    ranges = exp_string.split("~")
+    lower, upper = ranges[0], ranges[1]
+    if lower == "":
+        lower = 0
+    elif lower.isnumeric():
+        lower = int(lower)
+    else:
+        raise WxSyntaxError(f"Non numeric character in range {exp_string}")
+    if upper == "":
+        upper = None
+    elif upper.isnumeric():
+        upper = int(upper)
+    else:
+        raise WxSyntaxError(f"Non numeric character in range {exp_string}")
+    return lower, upper
+
+
+def _is_ellipsis_token(exp) -> bool:
+    """Check if an expected-shape token contains the ``...`` marker."""
+    return isinstance(exp, str) and "..." in exp
+
+
+def _is_optional_token(exp) -> bool:
+    """Check if an expected-shape token contains the ``(`` marker."""
+    return isinstance(exp, str) and "(" in exp
+
+
 def _compare(_int, exp_string):
     """Compare helper of two strings for _custom_shape_validator.
 
@@ -121,14 +182,15 @@ def _compare(_int, exp_string):
     a "~" and thus describes an interval or a string consisting of numbers. So if our
     integer is within the interval or equal to the described number, True is returned.
     The interval can be open, in that there is no number left or right of the "~"
-    symbol.
+    symbol. Fixed dimensions may also be passed as plain integers, which skips the
+    string handling entirely.
 
     Parameters
     ----------
     _int:
         Integer
     exp_string:
-        String with the expected dimension
+        String (or fixed integer) with the expected dimension
 
     Returns
     -------
@@ -166,25 +228,19 @@ def _compare(_int, exp_string):
     if _int < 0:
         raise WxSyntaxError("Negative dimension found")
 
-    if "~" in exp_string:
-        ranges = exp_string.split("~")
-
-        if ranges[0] == "":
-            ranges[0] = 0
-        elif ranges[0].isnumeric():
-            ranges[0] = int(ranges[0])
-        else:
-            raise WxSyntaxError(f"Non numeric character in range {exp_string}")
-        if ranges[1] == "":
-            ranges[1] = _int
-        elif ranges[1].isnumeric():
-            ranges[1] = int(ranges[1])
-        else:
-            raise WxSyntaxError(f"Non numeric character in range {exp_string}")
+    # fast paths for the dominant fixed-dimension case
+    if isinstance(exp_string, int):
+        return _int == exp_string
+    if exp_string.isdigit():
+        return _int == int(exp_string)
 
-        if ranges[0] > ranges[1]:
+    if "~" in exp_string:
+        lower, upper = _parse_range_bounds(exp_string)
+        if upper is None:
+            upper = _int
+        if lower > upper:
             raise WxSyntaxError(f"The range should not be descending in {exp_string}")
-        return int(ranges[0]) <= _int <= int(ranges[1])
+        return lower <= _int <= upper
 
     else:
         return _int == int(exp_string)
@@ -219,7 +275,7 @@ def _prepare_list(_list, list_expected):
     # turn around the list if "..." or "(" are at the beginning.
     # because the validation is made from begin -> end.
     # like this we validate the array from end -> begin.
-    if "(" in str(list_expected[0]) or "..." in str(list_expected[0]):
+    if _is_optional_token(list_expected[0]) or _is_ellipsis_token(list_expected[0]):
         list_expected = list(reversed(list_expected))
         _list = list(reversed(_list))
 
@@ -248,6 +304,10 @@ def _is_range_format_valid(format_string: str) -> bool:
     return format_string.isalnum()
 
 
+_expected_list_cache: dict[tuple, WxSyntaxError | None] = {}
+"""Cache of already validated expected lists (`None` if valid, else the error)."""
+
+
 def _validate_expected_list(list_expected):
     """Validate an expected List and raises exceptions.
 
@@ -272,23 +332,40 @@ def _validate_expected_list(list_expected):
     ValueError:
         ValueError will be raised if an rule violation is found
     """
+    # the check is purely syntactic, so its outcome can be cached per expected shape
+    key = tuple(list_expected)
+    if key in _expected_list_cache:
+        error = _expected_list_cache[key]
+        if error is not None:
+            raise error
+        return
+    try:
+        _check_expected_list(list_expected)
+    except WxSyntaxError as error:
+        _expected_list_cache[key] = error
+        raise
+    _expected_list_cache[key] = None
+
+
+def _check_expected_list(list_expected):
+    """Run the (uncached) syntax check of `_validate_expected_list`."""
     validator = 0
     for exp in list_expected:
-        if validator == 1 and not ("(" in str(exp) or "..." in str(exp)):
+        if validator == 1 and not (_is_optional_token(exp) or _is_ellipsis_token(exp)):
             raise WxSyntaxError(
                 "Optional dimensions in the expected "
                 "shape should only stand at the end/beginning."
             )
         if validator == 2:
             raise WxSyntaxError('After "..." should not be another dimension.')
-        if "..." in str(exp):
+        if _is_ellipsis_token(exp):
             if "..." != exp:
                 raise WxSyntaxError(
                     f'"..." should not have additional properties:' f" {exp} was found."
                 )
             validator = 2
-        elif "(" in str(exp):
-            val = re.search(r"\((.*)\)", exp)
+        elif _is_optional_token(exp):
+            val = _OPT_RE.search(exp)
             if (
                 val is None
                 or len(val.group(1)) + 2 != len(exp)
@@ -351,25 +428,30 @@ def _compare_lists(_list, list_expected) -> bool | dict:
 
     has_variable_dim_num = False
     for i, exp in enumerate(list_expected):
-        if "..." in str(exp):
+        if _is_ellipsis_token(exp):
             has_variable_dim_num = True
             break  # all the following dimensions are accepted
 
-        if "(" in str(exp):
+        if _is_optional_token(exp):
             if i < len(_list):
-                exp = re.search(r"\((.*)\)", exp).group(1)
+                exp = _OPT_RE.search(exp).group(1)
             else:  # pragma: no cover
                 continue  # TODO: actually covered, but not registered by codecov - bug?
 
         # all alphanumeric strings are OK - only numeric strings are not
         # eg: "n", "n1", "n1234", "myasdfstring1337"
-        if str(exp).isalnum() and not str(exp).isnumeric():
+        # None is treated like a variable name (arbitrary single dimension)
+        if exp is None or (
+            isinstance(exp, str) and exp.isalnum() and not exp.isnumeric()
+        ):
             if exp not in dict_values:
                 dict_values[exp] = _list[i]
             elif _list[i] != dict_values[exp]:
                 return False
 
-        elif i >= len(_list) or not _compare(_list[i], str(exp)):
+        elif i >= len(_list) or not _compare(
+            _list[i], exp if isinstance(exp, int) else str(exp)
+        ):
             return False
 
     if (len(_list) > len(list_expected)) and not has_variable_dim_num:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Union
 
 import pint
@@ -17,6 +18,44 @@ ExpressionParameterTypes = Union[
 __all__ = ["MathematicalExpression", "ExpressionParameterTypes"]
 
 
+@lru_cache(maxsize=1024)
+def _cached_sympify(expression: str) -> sympy.Expr:
+    """Parse an expression string into a sympy expression (cached).
+
+    The same expression strings reappear many times (process models, default
+    signals, ASDF round trips), so the parsing cost is only paid once each.
+    """
+    return sympy.sympify(expression)
+
+
+@lru_cache(maxsize=1024)
+def _cached_lambdify(expression: sympy.Expr, variables: tuple):
+    """Lambdify an expression for the given variables (cached).
+
+    Sympy expressions are immutable and hashable, so structurally identical
+    expressions share a single lambdified function. Constant subexpressions are
+    folded once via ``evalf`` and common subexpressions are eliminated, so they
+    are not re-evaluated on every call of the function.
+    """
+    return sympy.lambdify(variables, expression.evalf(), ("numpy", "scipy"), cse=True)
+
+
+@lru_cache(maxsize=1024)
+def _cached_math_equality(expr_1: sympy.Expr, expr_2: sympy.Expr) -> bool:
+    """Check two sympy expressions for mathematical equality (cached).
+
+    Most compared expressions are structurally identical (re-serialization,
+    cache lookups), so the cheap checks run first and the expensive
+    ``simplify`` only serves as the last resort.
+    """
+    if expr_1 == expr_2:  # structural equality implies mathematical equality
+        return True
+    diff = expr_1 - expr_2
+    if sympy.expand(diff) == 0:
+        return True
+    return sympy.simplify(diff) == 0
+
+
 class MathematicalExpression:
     """Mathematical expression using sympy syntax."""
 
@@ -36,17 +75,28 @@ class MathematicalExpression:
             expression.
 
         """
-        if not isinstance(expression, sympy.Expr):
+        if isinstance(expression, str):
+            expression = _cached_sympify(expression)
+        elif not isinstance(expression, sympy.Expr):
             expression = sympy.sympify(expression)
         if not isinstance(expression, sympy.Expr):
             raise TypeError("'expression' can't be converted to a sympy expression")
         self._expression: sympy.Expr = expression
 
-        self.function = sympy.lambdify(
-            tuple(self._expression.free_symbols), self._expression, ("numpy", "scipy")
+        self.function = _cached_lambdify(
+            self._expression, tuple(self._expression.free_symbols)
+        )
+
+        # cache the symbol names - sympy rebuilds the free_symbols set on every access
+        self._symbol_names: tuple[str, ...] = tuple(
+            str(var) for var in self._expression.free_symbols
         )
 
         self._parameters: dict[str, pint.Quantity | xr.DataArray] = {}
+        self._evaluation_params: dict[str, xr.DataArray] = {}
+        self._variable_names: tuple[str, ...] | None = None
+        # set by TimeSeries once the expression passed its array evaluation checks
+        self._array_eval_validated: bool = False
         if parameters is not None:
             self.set_parameters(parameters)
 
@@ -124,9 +174,7 @@ class MathematicalExpression:
             if check_structural_equality:
                 equality = self.expression == other.expression
             else:
-                from sympy import simplify
-
-                equality = simplify(self.expression - other.expression) == 0
+                equality = _cached_math_equality(self.expression, other.expression)
 
             if check_parameters:
                 from weldx.util import compare_nested
@@ -163,10 +211,8 @@ class MathematicalExpression:
         if not isinstance(params, dict):
             raise ValueError(f'"parameters" must be dictionary, got {type(params)}')
 
-        variable_names = [str(v) for v in self._expression.free_symbols]
-
         for k, v in params.items():
-            if k not in variable_names:
+            if k not in self._symbol_names:
                 raise ValueError(f'The expression does not have a parameter "{k}"')
             if isinstance(v, tuple):
                 v = xr.DataArray(v[0], dims=v[1])
@@ -178,6 +224,15 @@ class MathematicalExpression:
                 v = v.pint.quantify()
             self._parameters[k] = v
 
+        # prebind the converted parameters, so 'evaluate' does not rebuild them
+        self._evaluation_params = {
+            k: v if isinstance(v, xr.DataArray) else xr.DataArray(v)
+            for k, v in self._parameters.items()
+        }
+        # new parameters can change the broadcast behavior and variable set
+        self._array_eval_validated = False
+        self._variable_names = None
+
     @property
     def num_parameters(self):
         """Get the expressions number of parameters.
@@ -200,7 +255,7 @@ class MathematicalExpression:
             Number of free variables.
 
         """
-        return len(self.expression.free_symbols) - len(self._parameters)
+        return len(self._symbol_names) - len(self._parameters)
 
     @property
     def expression(self):
@@ -235,11 +290,11 @@ class MathematicalExpression:
             List of all expression variables
 
         """
-        return [
-            str(var)
-            for var in self._expression.free_symbols
-            if str(var) not in self._parameters
-        ]
+        if self._variable_names is None:
+            self._variable_names = tuple(
+                name for name in self._symbol_names if name not in self._parameters
+            )
+        return list(self._variable_names)
 
     def evaluate(self, **kwargs) -> Any:
         """Evaluate the expression for specific variable values.
@@ -266,8 +321,4 @@ class MathematicalExpression:
             for k, v in kwargs.items()
         }
 
-        parameters = {
-            k: v if isinstance(v, xr.DataArray) else xr.DataArray(v)
-            for k, v in self._parameters.items()
-        }
-        return self.function(**variables, **parameters)
+        return self.function(**variables, **self._evaluation_params)
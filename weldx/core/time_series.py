@@ -10,7 +10,7 @@ import pint
 import xarray as xr
 from _warnings import warn
 
-from weldx import Q_
+from weldx import Q_, U_
 from weldx import util as ut
 from weldx.exceptions import WeldxException
 from weldx.time import Time, TimeDependent, types_time_like, types_timestamp_like
@@ -26,6 +26,9 @@ __all__ = [
     "TimeSeries",
 ]
 
+_UNIT_SECOND = U_("s")
+_ZERO_TIMEDELTA = pd.Timedelta(0)
+
 
 class TimeSeries(TimeDependent):
     """Describes the behaviour of a quantity in time."""
@@ -70,10 +73,15 @@ class TimeSeries(TimeDependent):
         self._units = None
         self._interp_counter = 0
         self._reference_time = None
+        self._time_cache: Time | None = None
 
+        # the data type is fixed for the lifetime of the instance, so the
+        # properties can dispatch on a flag instead of repeated isinstance checks
         if isinstance(data, (pint.Quantity, xr.DataArray)):
+            self._is_discrete_data = True
             self._initialize_discrete(data, time, interpolation, reference_time)
         elif isinstance(data, MathematicalExpression):
+            self._is_discrete_data = False
             self._init_expression(data, reference_time)
         else:
             raise TypeError(f'The data type "{type(data)}" is not supported.')
@@ -97,7 +105,7 @@ class TimeSeries(TimeDependent):
         """
         if not isinstance(other, TimeSeries):
             return False
-        if not isinstance(self.data, MathematicalExpression):
+        if self._is_discrete_data:
             if not isinstance(other.data, pint.Quantity):
                 return False
             return self._data.identical(other.data_array)  # type: ignore
@@ -109,7 +117,7 @@ class TimeSeries(TimeDependent):
     def __repr__(self):
         """Give __repr__ output."""
         representation = "<TimeSeries>"
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             if self._data.shape[0] == 1:
                 representation += f"\nConstant value:\n\t{self.data.magnitude[0]}\n"
             else:
@@ -144,11 +152,10 @@ class TimeSeries(TimeDependent):
     def _create_data_array(
         data: pint.Quantity | xr.DataArray, time: Time
     ) -> xr.DataArray:
-        return (
-            xr.DataArray(data=data)
-            .rename({"dim_0": "time"})
-            .assign_coords({"time": time.as_data_array()})
-        )
+        # build the DataArray in one step instead of rename/assign_coords, which
+        # each create an intermediate object with fresh coordinate alignment
+        dims = ["time"] + [f"dim_{i}" for i in range(1, np.ndim(data))]
+        return xr.DataArray(data=data, dims=dims, coords={"time": time.as_data_array()})
 
     def _initialize_discrete(
         self,
@@ -174,7 +181,7 @@ class TimeSeries(TimeDependent):
 
             # constant value case
             if time is None:
-                time = pd.Timedelta(0)
+                time = _ZERO_TIMEDELTA
             time = Time(time, reference_time)
 
             self._data = self._create_data_array(data, time)
@@ -210,25 +217,73 @@ class TimeSeries(TimeDependent):
         if reference_time is not None:
             self._reference_time = pd.Timestamp(reference_time)
 
-        # check that all parameters of the expression support time arrays
-        try:
-            self.interp_time(Q_([1, 2], "second"))
-            self.interp_time(Q_([1, 2, 3], "second"))
-        except Exception as e:
-            raise WeldxException(
-                "The expression can not be evaluated with arrays of time deltas. "
-                "Ensure that all parameters that are multiplied with the time "
-                "variable have an outer dimension of size 1. This dimension is "
-                "broadcast during multiplication. The original error message was:"
-                f' "{str(e)}"'
-            ) from e
+        # check that all parameters of the expression support time arrays; skip the
+        # checks if the expression already passed them for its current parameters
+        if not data._array_eval_validated:
+            # without parameters there is nothing to broadcast against, so the
+            # scalar evaluation above already proves array support
+            if data.parameters:
+                try:
+                    # two different lengths so that a parameter whose trailing
+                    # dimension happens to match one of them can not slip through
+                    self.interp_time(Q_([1, 2], "second"))
+                    self.interp_time(Q_([1, 2, 3], "second"))
+                except Exception as e:
+                    raise WeldxException(
+                        "The expression can not be evaluated with arrays of time "
+                        "deltas. Ensure that all parameters that are multiplied "
+                        "with the time variable have an outer dimension of size 1. "
+                        "This dimension is broadcast during multiplication. "
+                        f'The original error message was: "{str(e)}"'
+                    ) from e
+            data._array_eval_validated = True
 
     def _interp_time_discrete(self, time: Time) -> xr.DataArray:
         """Interpolate the time series if its data is composed of discrete values."""
         data = self._data
+
+        if data.shape[0] == 1:
+            # a constant value broadcasts over the target times, no interpolation
+            # machinery required
+            time_new = time.as_data_array().data
+            magnitude = np.broadcast_to(
+                data.data.m[0], (len(time_new),) + data.data.m.shape[1:]
+            )
+            return xr.DataArray(
+                Q_(magnitude.copy(), data.data.units),
+                dims=data.dims,
+                coords={"time": time_new},
+            )
+
         if self.time is None and time.is_absolute:
             data = data.weldx.reset_reference_time(time.reference_time)  # type: ignore
 
+        if not time.is_absolute and data.ndim == 1 and len(data.time) > 1:
+            # fast path: dispatch 1d interpolation over sorted timedeltas directly
+            # to vectorized numpy kernels, which clamp out of range values to the
+            # edges just like xr_interp_like with fillna
+            time_ref = data.time.data
+            if np.all(time_ref[1:] > time_ref[:-1]):
+                time_new = time.as_data_array().data
+                magnitude = None
+                if self.interpolation == "linear":
+                    magnitude = np.interp(
+                        time_new.astype(np.int64),
+                        time_ref.astype(np.int64),
+                        data.data.m,
+                    )
+                elif self.interpolation == "step":
+                    # index of the last sample at or before each new time,
+                    # clamped so times before the first sample get its value
+                    idx = np.searchsorted(time_ref, time_new, side="right") - 1
+                    magnitude = data.data.m[idx.clip(min=0)]
+                if magnitude is not None:
+                    return xr.DataArray(
+                        Q_(magnitude, data.data.units),
+                        dims=["time"],
+                        coords={"time": time_new},
+                    )
+
         return ut.xr_interp_like(
             data,
             time.as_data_array(),
@@ -243,10 +298,17 @@ class TimeSeries(TimeDependent):
         if len(time_q.m.shape) == 0:
             time_q = np.expand_dims(time_q, 0)  # type: ignore
 
-        time_xr = xr.DataArray(time_q, dims=["time"])
+        if not self._data.parameters and time_q.u == _UNIT_SECOND:
+            # fast path: without parameters all units stem from the time variable,
+            # so evaluate the lambdified function on the raw magnitudes and attach
+            # the units determined at construction time (probed with seconds)
+            magnitude = self._data.function(**{self._time_var_name: time_q.m})
+            data = xr.DataArray(Q_(magnitude, self._units), dims=["time"])
+        else:
+            time_xr = xr.DataArray(time_q, dims=["time"])
 
-        # evaluate expression
-        data = self._data.evaluate(**{self._time_var_name: time_xr})
+            # evaluate expression
+            data = self._data.evaluate(**{self._time_var_name: time_xr})
         return data.assign_coords({"time": time.as_data_array()})
 
     @property
@@ -263,7 +325,7 @@ class TimeSeries(TimeDependent):
             A mathematical expression describing the time dependency
 
         """
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             return self._data.data
         return self._data
 
@@ -279,7 +341,7 @@ class TimeSeries(TimeDependent):
             The internal data as 'xarray.DataArray'
 
         """
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             return self._data
         return None
 
@@ -293,14 +355,14 @@ class TimeSeries(TimeDependent):
             Interpolation of the TimeSeries
 
         """
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             return self._data.attrs["interpolation"]
         return None
 
     @interpolation.setter
     def interpolation(self, interpolation):
         """Set the interpolation."""
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             if interpolation not in self._valid_interpolations:
                 raise ValueError(
                     "A valid interpolation method must be specified if discrete "
@@ -318,7 +380,7 @@ class TimeSeries(TimeDependent):
     @property
     def is_expression(self) -> bool:
         """Return `True` if the time series is described by an expression."""
-        return isinstance(self.data, MathematicalExpression)
+        return not self._is_discrete_data
 
     @property
     def time(self) -> None | Time:
@@ -330,8 +392,12 @@ class TimeSeries(TimeDependent):
             Timestamps of the  data
 
         """
-        if isinstance(self._data, xr.DataArray) and len(self._data.time) > 1:
-            return Time(self._data.time.data, self.reference_time)
+        if self._is_discrete_data and len(self._data.time) > 1:
+            # the data is fixed after construction, so the conversion of the time
+            # coordinates is only done on the first access
+            if self._time_cache is None:
+                self._time_cache = Time(self._data.time.data, self.reference_time)
+            return self._time_cache
         return None
 
     @property
@@ -374,11 +440,14 @@ class TimeSeries(TimeDependent):
                 f"{self._interp_counter} time(s)."
             )
 
-        # prepare timedelta values for internal interpolation
-        time = Time(time)
-        time_interp = Time(time, self.reference_time)
+        # prepare timedelta values for internal interpolation; without a reference
+        # time both views are identical, so the conversion is only done once
+        if not isinstance(time, Time):
+            time = Time(time)
+        reference_time = self.reference_time
+        time_interp = time if reference_time is None else Time(time, reference_time)
 
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             dax = self._interp_time_discrete(time_interp)
             ts = TimeSeries(data=dax.data, time=time, interpolation=self.interpolation)
         else:
@@ -454,7 +523,7 @@ class TimeSeries(TimeDependent):
             Tuple describing the data's shape
 
         """
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             return self._data.shape
         return self._shape
 
@@ -468,6 +537,6 @@ class TimeSeries(TimeDependent):
             The unit of the `TimeSeries`
 
         """
-        if isinstance(self._data, xr.DataArray):
+        if self._is_discrete_data:
             return self._data.data.units
         return self._units
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING
 from warnings import warn
 
 import pint
-from networkx import draw, draw_networkx_edge_labels
+from networkx import DiGraph, draw, draw_networkx_edge_labels
 
 from weldx.constants import Q_, U_
 from weldx.core import MathematicalExpression, TimeSeries
@@ -23,6 +23,9 @@ if TYPE_CHECKING:  # pragma: no cover
 
 # measurement --------------------------------------------------------------------------
 
+_VALID_SIGNAL_TYPES = frozenset(("analog", "digital"))
+_VALID_TYPE_TRANSFORMATIONS = frozenset(("AA", "AD", "DA", "DD"))
+
 
 @dataclass
 class Error:
@@ -41,7 +44,7 @@ class Signal:
 
     def __post_init__(self):
         """Perform some checks after construction."""
-        if self.signal_type not in ["analog", "digital"]:
+        if self.signal_type not in _VALID_SIGNAL_TYPES:
             raise ValueError(f"{self.signal_type} is an invalid signal type.")
         self.units = U_(self.units)
 
@@ -100,7 +103,7 @@ class SignalTransformation:
         """Perform some tests after construction."""
         if self.type_transformation is not None:
             self.type_transformation = self.type_transformation.upper()
-            if self.type_transformation not in ["AA", "AD", "DA", "DD"]:
+            if self.type_transformation not in _VALID_TYPE_TRANSFORMATIONS:
                 raise ValueError(
                     f"Invalid type transformation: {self.type_transformation}\n"
                     "Valid values are 'AA', 'AD', 'DA' and 'DD'."
@@ -257,8 +260,6 @@ class MeasurementChain:
         ...      )
 
         """
-        from networkx import DiGraph
-
         self._name = name
         self._source = source
         self._source_equipment: MeasurementEquipment = None
@@ -870,9 +871,9 @@ class MeasurementChain:
         """
         if signal_source == self._source.name:
             return self._source_equipment
-        for edge in self._graph.edges:
-            if edge[1] == signal_source:
-                return self._graph.edges[edge].get("equipment")
+        predecessors = self._graph.pred.get(signal_source)
+        if predecessors:
+            return next(iter(predecessors.values())).get("equipment")
         raise KeyError(f"No transformation with name '{signal_source}' found")
 
     def get_signal(self, signal_source: str) -> Signal:
@@ -928,9 +929,11 @@ class MeasurementChain:
             The requested transformation
 
         """
-        for edge in self._graph.edges:
-            if edge[1] == name:
-                return self._graph.edges[edge]["transformation"]
+        # transformations are named after their output node, so the incoming
+        # edge can be found directly instead of scanning all edges
+        predecessors = self._graph.pred.get(name)
+        if predecessors:
+            return next(iter(predecessors.values()))["transformation"]
 
         raise KeyError(f"No transformation with name '{name}' found")
 
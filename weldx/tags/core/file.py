@@ -48,9 +48,6 @@ class ExternalFileConverter(WeldxConverter):
     def from_yaml_tree(self, node: dict, tag: str, ctx):
         """Construct from tree."""
         buffer = node.pop("content", None)
-        if buffer is not None:
-            buffer = buffer.tobytes()
-            node["buffer"] = buffer
 
         hash_data = node.pop("content_hash", None)
         if hash_data is not None:
@@ -58,9 +55,15 @@ class ExternalFileConverter(WeldxConverter):
             node["hash"] = hash_data["value"]
 
         if buffer is not None:
-            hash_buffer = ExternalFile.calculate_hash(buffer, node["hashing_algorithm"])
+            # hash the asdf block in place via the buffer protocol and only
+            # materialize the bytes copy for the dataclass once it is verified
+            buffer = np.asarray(buffer)
+            hash_buffer = ExternalFile.calculate_hash(
+                memoryview(buffer), node["hashing_algorithm"]
+            )
             if hash_buffer != node["hash"]:  # pragma: no cover
                 raise WeldxException(
                     "The stored hash does not match the stored contents' hash."
                 )
+            node["buffer"] = buffer.tobytes()
         return ExternalFile(**node)
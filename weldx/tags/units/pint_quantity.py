@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import cache
+
 import pint
 from asdf.tagged import TaggedDict
 
@@ -32,7 +34,8 @@ class PintQuantityConverter(WeldxConverter):
         """Convert to python dict."""
         tree = {}
         value = obj.magnitude
-        if not value.shape:
+        # plain Python scalars need no conversion and have no shape to inspect
+        if not isinstance(value, (int, float)) and not value.shape:
             value = value.item()  # convert scalars to native Python numeric types
         tree["value"] = value
         tree["units"] = obj.units
@@ -70,8 +73,18 @@ class PintUnitConverter(WeldxConverter):
 
     def to_yaml_tree(self, obj: pint.Unit, tag: str, ctx) -> str:
         """Convert to python dict."""
-        return f"{obj:D}"  # use def/long (D) formatting for serialization
+        return _format_unit(obj)
 
     def from_yaml_tree(self, node: str, tag: str, ctx) -> pint.Unit:
         """Reconstruct from tree."""
         return U_(node)
+
+
+@cache
+def _format_unit(unit: pint.Unit) -> str:
+    """Format a unit with def/long (D) formatting for serialization (cached).
+
+    Files typically reuse a small vocabulary of units, while pint's formatter
+    walks the unit container on every call.
+    """
+    return f"{unit:D}"
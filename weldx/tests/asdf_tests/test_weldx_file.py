@@ -1,10 +1,9 @@
 """Tests for the WeldxFile class."""
 
+import functools
 import itertools
-import os
 import pathlib
 import shutil
-import tempfile
 from io import BytesIO
 
 import asdf
@@ -22,14 +21,47 @@ from weldx.util import compare_nested
 
 SINGLE_PASS_SCHEMA = "single_pass_weld-0.1.0"
 
+_tmp_file_counter = itertools.count()
+
+
+def _mktemp(tmpdir, suffix: str = ".asdf") -> str:
+    """Create a unique file path inside tmpdir without probing the filesystem.
+
+    Unlike tempfile.mktemp this is a pure path construction; uniqueness comes
+    from a module-level counter.
+    """
+    return str(pathlib.Path(tmpdir) / f"file{next(_tmp_file_counter)}{suffix}")
+
+
+@functools.cache
+def _compressed_asdf_payload() -> bytes:
+    """Serialize a zlib-compressed ASDF file once; the content is deterministic."""
+    buff = BytesIO()
+    with asdf.AsdfFile({"data": xr.DataArray(np.ones((100, 100)))}) as af:
+        af.write_to(buff, all_array_compression="zlib")
+    return buff.getvalue()
+
+
+@functools.cache
+def _single_pass_weld_payload() -> bytes:
+    """Create the serialized single pass weld example once; it is deterministic."""
+    buff, _ = single_pass_weld_example(None)
+    return buff.getvalue()
+
 
 class _ReadOnlyFile:
     """Simulate a read-only file."""
 
+    _seed_bytes = None  # seed ASDF content, serialized once for all instances
+
     def __init__(self, tmpdir):
-        fn = tempfile.mktemp(suffix=".asdf", dir=tmpdir)
+        fn = _mktemp(tmpdir, ".asdf")
+        if _ReadOnlyFile._seed_bytes is None:
+            buff = BytesIO()
+            asdf.AsdfFile(tree=dict(hi="there")).write_to(buff)
+            _ReadOnlyFile._seed_bytes = buff.getvalue()
         with open(fn, "wb") as fh:
-            asdf.AsdfFile(tree=dict(hi="there")).write_to(fh)
+            fh.write(_ReadOnlyFile._seed_bytes)
         self.mode = "rb"
         self.file_read_only = open(fn, mode=self.mode)
 
@@ -76,18 +108,24 @@ def test_protocol_check(tmpdir):
     assert isinstance(BytesIO(), SupportsFileReadWrite)
 
     # real file:
-    f = tempfile.mktemp(dir=tmpdir)
+    f = _mktemp(tmpdir, "")
     with open(f, "w") as fh:
         assert isinstance(fh, SupportsFileReadWrite)
 
 
-@pytest.fixture(scope="class")
-def simple_asdf_file(request):
-    """Create an ASDF file with a very simple tree and attaches it to cls."""
+@pytest.fixture(scope="session")
+def simple_asdf_file_payload():
+    """Serialize a very simple ASDF tree once per session."""
     f = asdf.AsdfFile(tree={META_ATTR: dict(welder="anonymous")})
     buff = BytesIO()
     f.write_to(buff)
-    request.cls.simple_asdf_file = buff
+    return buff.getvalue()
+
+
+@pytest.fixture(scope="class")
+def simple_asdf_file(request, simple_asdf_file_payload):
+    """Attach a buffer of the simple ASDF file to the test class."""
+    request.cls.simple_asdf_file = BytesIO(simple_asdf_file_payload)
 
 
 @pytest.mark.usefixtures("simple_asdf_file")
@@ -121,7 +159,7 @@ class TestWeldXFile:
     @pytest.mark.parametrize("dest_wrap", [str, pathlib.Path])
     def test_write_to_path_like(self, tmpdir, dest_wrap):
         """Test WeldxFile.write_to for str and pathlib.Path."""
-        fn = tempfile.mktemp(suffix=".asdf", dir=tmpdir)
+        fn = _mktemp(tmpdir, ".asdf")
         wrapped = dest_wrap(fn)
         self.fh.write_to(wrapped)
         # compare
@@ -147,7 +185,7 @@ class TestWeldXFile:
         """Test wrapper creation from a dictionary."""
         tree = dict(foo="bar")
         # should write to file
-        fn = tempfile.mktemp(suffix=".asdf", dir=tmpdir)
+        fn = _mktemp(tmpdir, ".asdf")
         self.fh = WeldxFile(filename_or_file_like=fn, tree=tree, mode="rw")
         new_file = self.make_copy(self.fh)
         assert WeldxFile(new_file)["foo"] == "bar"
@@ -155,25 +193,24 @@ class TestWeldXFile:
     @staticmethod
     def test_create_from_tree_given_output_fn_wrong_mode(tmpdir):
         """Passing data to be written in read-only mode should raise."""
-        fn = tempfile.mktemp(suffix=".asdf", dir=tmpdir)
+        fn = _mktemp(tmpdir, ".asdf")
 
         with pytest.raises(RuntimeError):
             WeldxFile(fn, tree=dict(foo="bar"), mode="r")
 
-    def test_create_from_tree(self, tmpdir):
+    @pytest.mark.parametrize("fd_type", ["buffer", "path"])
+    def test_create_from_tree(self, tmpdir, fd_type):
         """Test wrapper creation from a dictionary."""
         tree = dict(foo="bar")
-        # actually this would be a case for pytests parameterization, but...
-        # it doesn't support fixtures in parameterization yet.
-        for fd in [BytesIO(), tempfile.mktemp(suffix=".asdf", dir=tmpdir)]:
-            fh = WeldxFile(fd, tree=tree, mode="rw")
-            fh["another"] = "entry"
-            # sync to new file.
-            new_file = self.make_copy(fh)
-            # check tree changes have been written.
-            fh2 = WeldxFile(new_file)
-            assert fh2["foo"] == "bar"
-            assert fh["another"] == "entry"
+        fd = BytesIO() if fd_type == "buffer" else _mktemp(tmpdir, ".asdf")
+        fh = WeldxFile(fd, tree=tree, mode="rw")
+        fh["another"] = "entry"
+        # sync to new file.
+        new_file = self.make_copy(fh)
+        # check tree changes have been written.
+        fh2 = WeldxFile(new_file)
+        assert fh2["foo"] == "bar"
+        assert fh["another"] == "entry"
 
     @staticmethod
     def test_create_writable_protocol():
@@ -199,7 +236,7 @@ class TestWeldXFile:
     @staticmethod
     def test_create_but_no_overwrite_existing(tmpdir):
         """Never (accidentally) overwrite existing files."""
-        f = tempfile.mktemp(dir=tmpdir)
+        f = _mktemp(tmpdir, "")
         with open(f, "w") as fh:
             fh.write("something")
         with pytest.raises(FileExistsError):
@@ -207,7 +244,7 @@ class TestWeldXFile:
 
     def test_update_existing_asdf_file(self, tmpdir):
         """Check existing files are updated."""
-        f = tempfile.mktemp(dir=tmpdir)
+        f = _mktemp(tmpdir, "")
         self.fh.write_to(f)
         with WeldxFile(f, mode="rw") as fh:
             fh[META_ATTR]["key"] = True
@@ -218,12 +255,12 @@ class TestWeldXFile:
     @staticmethod
     def make_copy(fh):
         """Guess what, creates a copy of fh."""
+        if isinstance(fh, BytesIO):
+            # getvalue is position independent and the constructor copies once
+            return BytesIO(fh.getvalue())
         buff = BytesIO()
         if isinstance(fh, WeldxFile):
             fh.write_to(buff)
-        elif isinstance(fh, BytesIO):
-            fh.seek(0)
-            buff.write(fh.read())
         buff.seek(0)
         return buff
 
@@ -249,7 +286,7 @@ class TestWeldXFile:
     @staticmethod
     def test_underlying_filehandle_closed(tmpdir):
         """Ensure file handles are being closed."""
-        fn = tempfile.mktemp(suffix=".asdf", dir=tmpdir)
+        fn = _mktemp(tmpdir, ".asdf")
 
         with WeldxFile(fn, mode="rw") as wfile:
             wfile["updated"] = True
@@ -308,7 +345,7 @@ class TestWeldXFile:
     @pytest.mark.parametrize("schema_arg", ["custom_schema", "asdffile_kwargs"])
     def test_custom_schema(schema_arg):
         """Check the property complex_schema is being set."""
-        buff, _ = single_pass_weld_example(None)
+        buff = BytesIO(_single_pass_weld_payload())
         schema = get_schema_path("datamodels/single_pass_weld-0.1.0.yaml")
         kwargs = {schema_arg: schema}
         if schema_arg == "asdffile_kwargs":
@@ -437,7 +474,7 @@ properties:
         def get_mem_info():
             return proc.memory_info().rss
 
-        fn = tempfile.mktemp(suffix=".wx", dir=tmpdir)
+        fn = _mktemp(tmpdir, ".wx")
         with WeldxFile(mode=mode) as fh:
             fh["x"] = large_array
             before = get_mem_info()
@@ -489,16 +526,14 @@ properties:
 
         Even under different conditions like compression.
         """
-        fn = tempfile.mktemp(suffix=".wx", dir=tmpdir)
+        fn = _mktemp(tmpdir, ".wx")
 
         def get_size_and_mtime(fn):
             stat = pathlib.Path(fn).stat()
             return stat.st_size, stat.st_mtime_ns
 
-        # compressed file created with asdf
-        with asdf.AsdfFile({"data": xr.DataArray(np.ones((100, 100)))}) as af:
-            af.write_to(fn, all_array_compression="zlib")
-            af.close()
+        # compressed file created with asdf (serialized once, see below)
+        pathlib.Path(fn).write_bytes(_compressed_asdf_payload())
 
         size_asdf = get_size_and_mtime(fn)
 
@@ -516,7 +551,7 @@ properties:
     def test_copy(self, file, tmpdir):
         """Take a copy written to physical file, bytesio and check output."""
         if file == "physical":
-            file = tempfile.mktemp(suffix=".wx", dir=tmpdir)
+            file = _mktemp(tmpdir, ".wx")
 
         wx_copy = self.fh.copy(filename_or_file_like=file)
 
@@ -533,7 +568,7 @@ properties:
     @pytest.mark.parametrize("overwrite", [True, False])
     def test_copy_overwrite_non_wx_file(self, overwrite, tmpdir):
         """Avoid overwriting existing files."""
-        file = tempfile.mktemp(suffix=".wx", dir=tmpdir)
+        file = _mktemp(tmpdir, ".wx")
         with open(file, "w") as fh:
             fh.write("nope")
         if not overwrite:
@@ -544,7 +579,7 @@ properties:
             self.fh.copy(file, overwrite=overwrite)
 
     @staticmethod
-    def test_update_existing_proper_update(tmpdir):
+    def test_update_existing_proper_update(tmp_path):
         """Compare implementation of WeldxFile with asdf api.
 
         WeldxFile should call update() to minimize memory usage."""
@@ -562,31 +597,30 @@ properties:
             {"d3": d3},
         ]
 
-        os.chdir(tmpdir)
+        # work on absolute paths instead of changing the process working directory,
+        # which would leak into other tests
+        wx_path = tmp_path / "test.wx"
+        asdf_path = tmp_path / "test.asdf"
+
         for tree in trees:
-            WeldxFile("test.wx", mode="rw", tree=tree)
+            WeldxFile(wx_path, mode="rw", tree=tree)
 
         # AsdfFile version
-        asdf.AsdfFile(trees[0]).write_to("test.asdf")
+        asdf.AsdfFile(trees[0]).write_to(str(asdf_path))
 
         for tree in trees[1:]:
-            f = asdf.open("test.asdf", mode="rw")
+            f = asdf.open(str(asdf_path), mode="rw")
             f.tree = tree
             f.update()
             f.close()
 
         # file sizes should be almost equal (array inlining in wxfile).
-        a = pathlib.Path("test.asdf").stat().st_size
-        b = pathlib.Path("test.wx").stat().st_size
+        a = asdf_path.stat().st_size
+        b = wx_path.stat().st_size
         assert a >= b
 
         if a == b:
-
-            def _read(fn):
-                with open(fn, "br") as fh:
-                    return fh.read()
-
-            assert _read("test.asdf") == _read("test.wx")
+            assert asdf_path.read_bytes() == wx_path.read_bytes()
 
     @pytest.mark.filterwarnings("ignore:You tried to manipulate an ASDF internal")
     @pytest.mark.filterwarnings("ignore:Call to deprecated function data.")
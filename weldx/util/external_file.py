@@ -1,17 +1,30 @@
 """External file utilities."""
 
 import mimetypes
+import shutil
 import socket
 from dataclasses import dataclass
+from functools import lru_cache
 from hashlib import md5, sha256
 from pathlib import Path
 from typing import Union
 
 import pandas as pd
 
+try:  # Python >= 3.11
+    from hashlib import file_digest
+except ImportError:
+    file_digest = None
+
 __all__ = ["ExternalFile"]
 
 
+@lru_cache(maxsize=1)
+def _get_hostname() -> str:
+    """Get the hostname of this machine (cached, it cannot change mid-process)."""
+    return socket.gethostname()
+
+
 @dataclass
 class ExternalFile:
     """Handles the asdf serialization of external files."""
@@ -48,7 +61,7 @@ class ExternalFile:
             self.directory = self.path.parent.absolute().as_posix()
             self.mimetype = mimetypes.guess_type(self.path)[0]
             if self.hostname is None:
-                self.hostname = socket.gethostname()
+                self.hostname = _get_hostname()
 
             stat = self.path.stat()
             self.size = stat.st_size
@@ -63,7 +76,7 @@ class ExternalFile:
 
     @staticmethod
     def calculate_hash(
-        path_or_buffer: Union[str, Path, bytes],
+        path_or_buffer: Union[str, Path, bytes, bytearray, memoryview],
         algorithm: str,
         buffer_size: int = 65536,
     ) -> str:
@@ -71,8 +84,8 @@ class ExternalFile:
 
         Parameters
         ----------
-        path_or_buffer : Union[str, pathlib.Path, bytes]
-            Path of the file or buffer as bytes
+        path_or_buffer : Union[str, pathlib.Path, bytes, bytearray, memoryview]
+            Path of the file or a bytes-like buffer
         algorithm : str
             Name of the desired hashing algorithm
         buffer_size : int
@@ -86,15 +99,21 @@ class ExternalFile:
 
         """
         hashing_class = ExternalFile.hash_mapping[algorithm.upper()]()
-        if isinstance(path_or_buffer, bytes):
+        if isinstance(path_or_buffer, (bytes, bytearray, memoryview)):
             hashing_class.update(path_or_buffer)
         else:
             with open(path_or_buffer, "rb") as file:
-                while True:
-                    data = file.read(buffer_size)
-                    if not data:
-                        break
-                    hashing_class.update(data)
+                if file_digest is not None:
+                    # streams in C, releases the GIL and feeds the hash large
+                    # contiguous buffers
+                    return file_digest(
+                        file, ExternalFile.hash_mapping[algorithm.upper()]
+                    ).hexdigest()
+                # reuse one buffer instead of allocating a bytes object per chunk
+                buffer = bytearray(buffer_size)
+                view = memoryview(buffer)
+                while chunk_size := file.readinto(buffer):
+                    hashing_class.update(view[:chunk_size])
         return hashing_class.hexdigest()
 
     def get_file_content(self) -> bytes:
@@ -121,6 +140,11 @@ class ExternalFile:
         """
         path = Path(f"{directory}/{self.filename}")
 
+        if self.buffer is None and file_system is None:
+            # copy at kernel level instead of reading the whole file into memory
+            shutil.copyfile(self.path, path)
+            return
+
         buffer = self.buffer
         if buffer is None:
             buffer = self.get_file_content()